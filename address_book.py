@@ -1,7 +1,8 @@
-from collections import UserDict
-from typing import List, Optional
+from calendar import isleap
+from collections import UserDict, defaultdict
+from typing import Callable, DefaultDict, Iterable, List, Optional, Tuple
 from record import Record
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 
 class AddressBook(UserDict):
     """
@@ -9,11 +10,77 @@ class AddressBook(UserDict):
 
     Methods:
         add_record(record): Adds a record to the address book.
+        add_records(records): Adds several records to the address book at once.
+        copy(): Returns a copy that shares records but has its own index.
         find(name): Finds a record by name.
         delete(name): Deletes a record by name.
         get_upcoming_birthdays(): Gets contacts with upcoming birthdays within the next 7 days.
+        get_upcoming_birthdays_cached(render): Renders upcoming birthdays, reusing the last result.
     """
 
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes an AddressBook instance.
+
+        The mutation counter is bumped whenever the book or one of its records
+        changes, so callers can cache results derived from the book's contents.
+        Records with a birthday are also indexed by (month, day).
+        """
+        self._mut = 0
+        self._by_md: DefaultDict[Tuple[int, int], List[Record]] = defaultdict(list)
+        # Last get_upcoming_birthdays_cached() result as (day ordinal, mutation counter, response).
+        self._bday_cache: Optional[Tuple[int, int, str]] = None
+        super().__init__(*args, **kwargs)
+
+    def copy(self) -> "AddressBook":
+        """
+        Returns a shallow copy of the address book.
+
+        The copy holds the same records but has its own birthday index,
+        mutation counter and cache.
+
+        Returns:
+            AddressBook: The copy.
+        """
+        return type(self)(self.data)
+
+    def __copy__(self) -> "AddressBook":
+        """
+        Supports copy.copy() by delegating to copy().
+
+        Returns:
+            AddressBook: The copy.
+        """
+        return self.copy()
+
+    def __setitem__(self, name: str, record: Record) -> None:
+        """
+        Stores a record under the given name, replacing any existing one.
+
+        Args:
+            name (str): The name of the contact.
+            record (Record): The record to store.
+        """
+        if name in self.data:
+            del self[name]
+        self.data[name] = record
+        self._attach(record)
+        self._mut += 1
+
+    def __delitem__(self, name: str) -> None:
+        """
+        Removes the record stored under the given name.
+
+        Args:
+            name (str): The name of the contact.
+
+        Raises:
+            KeyError: If there is no record with this name.
+        """
+        record = self.data.pop(name)
+        self._detach(record)
+        self._mut += 1
+
     def add_record(self, record: Record) -> None:
         """
         Adds a record to the address book.
@@ -24,7 +91,28 @@ class AddressBook(UserDict):
         if record.name.value in self.data:
             print(f"Contact {record.name} already exists.")
         else:
-            self.data[record.name.value] = record
+            self[record.name.value] = record
+
+    def add_records(self, records: Iterable[Record]) -> None:
+        """
+        Adds several records to the address book at once.
+
+        Args:
+            records (Iterable[Record]): The records to add.
+        """
+        new_records = {}
+        for record in records:
+            name = record.name.value
+            if name in self.data or name in new_records:
+                print(f"Contact {record.name} already exists.")
+            else:
+                new_records[name] = record
+        if not new_records:
+            return
+        for record in new_records.values():
+            self._attach(record)
+        self.data.update(new_records)
+        self._mut += 1
 
     def find(self, name: str) -> Optional[Record]:
         """
@@ -46,23 +134,95 @@ class AddressBook(UserDict):
             name (str): The name of the record to delete.
         """
         if name in self.data:
-            del self.data[name]
+            del self[name]
         else:
             print(f"Contact {name} not found.")
 
+    def _attach(self, record: Record) -> None:
+        """
+        Registers this book with a record and adds the record to the birthday index.
+
+        A record may belong to several books; each of them is kept up to date
+        when the record changes.
+
+        Args:
+            record (Record): The record to attach.
+        """
+        record._books[id(self)] = self
+        self._index_birthday(record)
+
+    def _detach(self, record: Record) -> None:
+        """
+        Unregisters this book from a record and removes it from the birthday index.
+
+        Args:
+            record (Record): The record to detach.
+        """
+        self._unindex_birthday(record)
+        record._books.pop(id(self), None)
+
+    def _index_birthday(self, record: Record) -> None:
+        """
+        Registers a record in the birthday index.
+
+        Args:
+            record (Record): The record to register.
+        """
+        if record.birthday:
+            self._by_md[record.birthday.month_day].append(record)
+
+    def _unindex_birthday(self, record: Record) -> None:
+        """
+        Removes a record from the birthday index.
+
+        Args:
+            record (Record): The record to remove.
+        """
+        if not record.birthday:
+            return
+        key = record.birthday.month_day
+        bucket = self._by_md.get(key)
+        if bucket and record in bucket:
+            bucket.remove(record)
+            if not bucket:
+                del self._by_md[key]
+
     def get_upcoming_birthdays(self) -> List[Record]:
         """
         Gets contacts with upcoming birthdays within the next 7 days.
 
+        In non-leap years, birthdays on 29 February are celebrated on 28 February.
+
         Returns:
             List[Record]: A list of records with upcoming birthdays.
         """
-        today = datetime.today()
+        day = date.today()
         upcoming_birthdays = []
-        for record in self.data.values():
-            if record.birthday:
-                birthday = datetime.strptime(record.birthday.value, "%d.%m.%Y")
-                birthday = birthday.replace(year=today.year)
-                if today <= birthday <= today + timedelta(days=7):
-                    upcoming_birthdays.append(record)
-        return upcoming_birthdays
\ No newline at end of file
+        for _ in range(7):
+            day += timedelta(days=1)
+            bucket = self._by_md.get((day.month, day.day))
+            if bucket:
+                upcoming_birthdays.extend(bucket)
+            if day.month == 2 and day.day == 28 and not isleap(day.year):
+                upcoming_birthdays.extend(self._by_md.get((2, 29), ()))
+        return upcoming_birthdays
+
+    def get_upcoming_birthdays_cached(self, render: Callable[[List[Record]], str]) -> str:
+        """
+        Renders the upcoming birthdays, reusing the last result while the day
+        and the book's contents are unchanged.
+
+        Args:
+            render (Callable[[List[Record]], str]): Formats the upcoming birthdays.
+
+        Returns:
+            str: The rendered upcoming birthdays.
+        """
+        today = date.today().toordinal()
+        if self._bday_cache is not None:
+            cached_day, cached_mut, response = self._bday_cache
+            if cached_day == today and cached_mut == self._mut:
+                return response
+        response = render(self.get_upcoming_birthdays())
+        self._bday_cache = (today, self._mut, response)
+        return response
\ No newline at end of file
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Tuple
 from field import Field
 
 class Birthday(Field):
@@ -35,4 +36,15 @@ class Birthday(Field):
             datetime.strptime(value, "%d.%m.%Y")
         except ValueError:
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
-        return value
\ No newline at end of file
+        return value
+
+    @property
+    def month_day(self) -> Tuple[int, int]:
+        """
+        Returns the (month, day) pair of the birthday.
+
+        Returns:
+            Tuple[int, int]: The month and day of the birthday.
+        """
+        date = datetime.strptime(self.value, "%d.%m.%Y")
+        return date.month, date.day
\ No newline at end of file
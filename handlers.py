@@ -1,28 +1,27 @@
-from functools import wraps
-from typing import List
-from address_book import AddressBook
-from record import Record
+from __future__ import annotations
 
-def input_error(func):
-    """
-    Decorator to handle input errors and return error messages.
+import sys
+from collections import defaultdict
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 
-    Args:
-        func: The function to wrap.
+from birthday import Birthday
+from phone import Phone
+from record import Record
 
-    Returns:
-        The wrapped function.
-    """
-    @wraps(func)
-    def inner(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except (KeyError, ValueError, IndexError) as e:
-            return str(e)
-    return inner
+if TYPE_CHECKING:
+    from address_book import AddressBook
 
+_MSG_ADDED = sys.intern("Contact added.")
+_MSG_UPDATED = sys.intern("Contact updated.")
+_MSG_DUPLICATE = sys.intern("Contact with this name and phone number already exists.")
+_MSG_NOT_FOUND = sys.intern("Contact not found.")
+_MSG_PHONE_UPDATED = sys.intern("Phone number updated.")
+_MSG_PHONE_REMOVED = sys.intern("Phone number removed.")
+_MSG_PHONE_NOT_FOUND = sys.intern("Phone number not found in the contact.")
+_MSG_BIRTHDAY_ADDED = sys.intern("Birthday added.")
+_MSG_BOOK_EMPTY = sys.intern("The address book is empty.")
+_MSG_NO_BIRTHDAYS = sys.intern("No birthdays in the next 7 days.")
 
-@input_error
 def add_contact(args: List[str], book: AddressBook) -> str:
     """
     Adds a contact to the address book.
@@ -34,15 +33,12 @@ def add_contact(args: List[str], book: AddressBook) -> str:
     Returns:
         str: The response message.
     """
-    if len(args) < 2:
-        raise ValueError("Error: Give me name and phone please.")
-    
     name, phone, *optional_args = args
     birthday = optional_args[0] if optional_args else None
     
-    existing_record = book.find(name)
-    if existing_record and any(phone == p.value for p in existing_record.phones):
-        return "Contact with this name and phone number already exists."
+    existing_record = book.data.get(name)
+    if existing_record and existing_record.find_phone(phone) is not None:
+        return _MSG_DUPLICATE
     
     if existing_record:
         existing_record.add_phone(phone)
@@ -52,11 +48,55 @@ def add_contact(args: List[str], book: AddressBook) -> str:
         if birthday:
             record.add_birthday(birthday)
         book.add_record(record)
-        return "Contact added."
+        return _MSG_ADDED
+
+    return _MSG_UPDATED
+
+def add_contacts_bulk(pairs: Iterable[Tuple[str, str, Optional[str]]], book: AddressBook) -> str:
+    """
+    Adds many contacts to the address book in one pass, e.g. for a CSV import.
+
+    Every phone number and birthday is validated before the book is changed,
+    so an invalid row leaves the book untouched. A birthday given for an
+    existing contact replaces its current one.
+
+    Args:
+        pairs (Iterable[Tuple[str, str, Optional[str]]]): (name, phone, birthday) tuples.
+        book (AddressBook): The address book instance.
 
-    return "Contact updated."
+    Returns:
+        str: The response message.
+
+    Raises:
+        ValueError: If a phone number or birthday is not valid.
+    """
+    grouped = defaultdict(list)
+    for name, phone, birthday in pairs:
+        grouped[name].append((Phone(phone).value, Birthday(birthday).value if birthday else None))
+
+    new_records = []
+    updated = 0
+    for name, entries in grouped.items():
+        record = book.data.get(name)
+        is_new = record is None
+        if is_new:
+            record = Record(name)
+        changed = False
+        for phone, birthday in entries:
+            if record.find_phone(phone) is None:
+                record.add_phone(phone)
+                changed = True
+            if birthday and (record.birthday is None or record.birthday.value != birthday):
+                record.add_birthday(birthday)
+                changed = True
+        if is_new:
+            new_records.append(record)
+        elif changed:
+            updated += 1
+
+    book.add_records(new_records)
+    return "Contacts added: %d, updated: %d." % (len(new_records), updated)
 
-@input_error
 def change_contact(args: List[str], book: AddressBook) -> str:
     """
     Changes a phone number for an existing contact or removes a phone number if only two arguments are provided.
@@ -71,28 +111,21 @@ def change_contact(args: List[str], book: AddressBook) -> str:
     if len(args) == 3:
         # Three arguments: change the phone number
         name, old_phone, new_phone = args
-        record = book.find(name)
-        if record:
+        if (record := book.data.get(name)) is not None:
             record.edit_phone(old_phone, new_phone)
-            return "Phone number updated."
-        return "Contact not found."
-    
-    elif len(args) == 2:
-        # Two arguments: remove the phone number
-        name, phone_to_remove = args
-        record = book.find(name)
-        if record:
-            if record.find_phone(phone_to_remove):
-                record.remove_phone(phone_to_remove)
-                return "Phone number removed."
-            else:
-                return "Phone number not found in the contact."
-        return "Contact not found."
+            return _MSG_PHONE_UPDATED
+        return _MSG_NOT_FOUND
     
-    else:
-        raise ValueError("Error: Give me name, old phone and new phone please or name and phone to remove.")
+    # Two arguments: remove the phone number
+    name, phone_to_remove = args
+    if (record := book.data.get(name)) is not None:
+        if record.find_phone(phone_to_remove):
+            record.remove_phone(phone_to_remove)
+            return _MSG_PHONE_REMOVED
+        else:
+            return _MSG_PHONE_NOT_FOUND
+    return _MSG_NOT_FOUND
 
-@input_error
 def show_phone(args: List[str], book: AddressBook) -> str:
     """
     Shows the phone number for the specified contact.
@@ -104,36 +137,31 @@ def show_phone(args: List[str], book: AddressBook) -> str:
     Returns:
         str: The response message.
     """
-    if len(args) != 1:
-        raise ValueError("Error: Give me name, please.")
-    
     name = args[0]
-    record = book.find(name)
-    if record:
-        phones = ", ".join([str(phone) for phone in record.phones])
-        return f"{name}: {phones}"
-    return "Contact not found."
+    if (record := book.data.get(name)) is not None:
+        return "%s: %s" % (name, record.phones_joined())
+    return _MSG_NOT_FOUND
 
-@input_error
-def show_all(book: AddressBook) -> str:
+def add_birthday(args: List[str], book: AddressBook) -> str:
     """
-    Shows all contacts in the address book.
+    Adds a birthday to the specified contact.
 
     Args:
+        args (List[str]): The arguments for the command.
         book (AddressBook): The address book instance.
 
     Returns:
         str: The response message.
     """
-    if not book:
-        return "The address book is empty."
-    
-    return "\n".join([str(record) for record in book.values()])
+    name, birthday = args
+    if (record := book.data.get(name)) is not None:
+        record.add_birthday(birthday)
+        return _MSG_BIRTHDAY_ADDED
+    return _MSG_NOT_FOUND
 
-@input_error
-def add_birthday(args: List[str], book: AddressBook) -> str:
+def show_birthday(args: List[str], book: AddressBook) -> str:
     """
-    Adds a birthday to the specified contact.
+    Shows the birthday for the specified contact.
 
     Args:
         args (List[str]): The arguments for the command.
@@ -142,20 +170,14 @@ def add_birthday(args: List[str], book: AddressBook) -> str:
     Returns:
         str: The response message.
     """
-    if len(args) != 2:
-        raise ValueError("Error: Give me name and birthday please.")
-    
-    name, birthday = args
-    record = book.find(name)
-    if record:
-        record.add_birthday(birthday)
-        return "Birthday added."
-    return "Contact not found."
+    name = args[0]
+    if (record := book.data.get(name)) is not None:
+        return "%s: %s" % (name, record.birthday)
+    return _MSG_NOT_FOUND
 
-@input_error
-def show_birthday(args: List[str], book: AddressBook) -> str:
+def show_all(args: List[str], book: AddressBook) -> str:
     """
-    Shows the birthday for the specified contact.
+    Shows all contacts in the address book.
 
     Args:
         args (List[str]): The arguments for the command.
@@ -164,16 +186,29 @@ def show_birthday(args: List[str], book: AddressBook) -> str:
     Returns:
         str: The response message.
     """
-    if len(args) != 1:
-        raise ValueError("Error: Give me name, please.")
+    if not book:
+        return _MSG_BOOK_EMPTY
     
-    name = args[0]
-    record = book.find(name)
-    if record:
-        return f"{name}: {record.birthday}"
-    return "Contact not found."
+    return "\n".join(str(record) for record in book.values())
+
+def _format_birthdays(upcoming_birthdays: List[Record]) -> str:
+    """
+    Formats the upcoming birthdays response.
+
+    Args:
+        upcoming_birthdays (List[Record]): The records with upcoming birthdays.
+
+    Returns:
+        str: The response message.
+    """
+    if not upcoming_birthdays:
+        return _MSG_NO_BIRTHDAYS
+    return "\n".join(
+        "Upcoming birthday within the next week: %s - %s, Phones: %s"
+        % (record.name, record.birthday, record.phones_joined())
+        for record in upcoming_birthdays
+    )
 
-@input_error
 def birthdays(args: List[str], book: AddressBook) -> str:
     """
     Shows upcoming birthdays within the next 7 days.
@@ -185,10 +220,4 @@ def birthdays(args: List[str], book: AddressBook) -> str:
     Returns:
         str: The response message.
     """
-    upcoming_birthdays = book.get_upcoming_birthdays()
-    if not upcoming_birthdays:
-        return "No birthdays in the next 7 days."
-    return "\n".join(
-        f"Upcoming birthday within the next week: {record.name} - {record.birthday}, Phones: {', '.join(str(phone) for phone in record.phones)}"
-        for record in upcoming_birthdays
-    )
\ No newline at end of file
+    return book.get_upcoming_birthdays_cached(_format_birthdays)
\ No newline at end of file
@@ -1,12 +1,54 @@
+import importlib
+from typing import Callable
 from address_book import AddressBook
-from handlers import (
-    add_contact, change_contact, show_phone, show_all,
-    add_birthday, show_birthday, birthdays
+
+_INVALID_MSG = (
+    "Invalid command. Available commands are: hello, add, change, phone, all, "
+    "add-birthday, show-birthday, birthdays, close, exit, bye."
 )
 
+_EXIT_COMMANDS = frozenset({"close", "exit", "bye"})
+
+_ERR_NAME = "Error: Give me name, please."
+
+# action -> (min_arity, max_arity, handler, arity_error); max_arity None means unbounded.
+# A handler given as a (module, attribute) pair is imported on first use and
+# then replaced by the function itself.
+_DISPATCH = {
+    "hello": (0, None, lambda args, book: "How can I help you?", None),
+    "add": (2, None, ("handlers", "add_contact"), "Error: Give me name and phone please."),
+    "change": (2, 3, ("handlers", "change_contact"),
+               "Error: Give me name, old phone and new phone please or name and phone to remove."),
+    "phone": (1, 1, ("handlers", "show_phone"), _ERR_NAME),
+    "all": (0, None, ("handlers", "show_all"), None),
+    "add-birthday": (2, 2, ("handlers", "add_birthday"), "Error: Give me name and birthday please."),
+    "show-birthday": (1, 1, ("handlers", "show_birthday"), _ERR_NAME),
+    "birthdays": (0, None, ("handlers", "birthdays"), None),
+    **{action: (0, None, lambda args, book: "Good bye!", None) for action in _EXIT_COMMANDS},
+}
+
+def _load_handler(action: str) -> Callable:
+    """
+    Imports the handler for an action and stores it in the dispatch table,
+    so later calls use the function directly.
+
+    Args:
+        action (str): The command whose handler should be loaded.
+
+    Returns:
+        Callable: The handler function.
+    """
+    min_arity, max_arity, (module_name, attr), arity_error = _DISPATCH[action]
+    fn = getattr(importlib.import_module(module_name), attr)
+    _DISPATCH[action] = (min_arity, max_arity, fn, arity_error)
+    return fn
+
 def handle_action(action: str, args: list[str], book: AddressBook) -> str:
     """
-    Handles the action by calling the appropriate function using match...case.
+    Handles the action by looking up the appropriate function in the dispatch table.
+
+    The number of arguments is checked against the table before the handler is called,
+    and input errors raised by the handler are returned as the response message.
 
     Args:
         action (str): The command to execute.
@@ -16,27 +58,18 @@ def handle_action(action: str, args: list[str], book: AddressBook) -> str:
     Returns:
         str: The response string after executing the command.
     """
-    match action:
-        case "hello":
-            return "How can I help you?"
-        case "add":
-            return add_contact(args, book)
-        case "change":
-            return change_contact(args, book)
-        case "phone":
-            return show_phone(args, book)
-        case "all":
-            return show_all(book)
-        case "add-birthday":
-            return add_birthday(args, book)
-        case "show-birthday":
-            return show_birthday(args, book)
-        case "birthdays":
-            return birthdays(args, book)
-        case "close" | "exit" | "bye":
-            return "Good bye!"
-        case _:
-            return "Invalid command. Available commands are: hello, add, change, phone, all, add-birthday, show-birthday, birthdays, close, exit, bye."
+    entry = _DISPATCH.get(action)
+    if entry is None:
+        return _INVALID_MSG
+    min_arity, max_arity, fn, arity_error = entry
+    if len(args) < min_arity or (max_arity is not None and len(args) > max_arity):
+        return arity_error
+    if isinstance(fn, tuple):
+        fn = _load_handler(action)
+    try:
+        return fn(args, book)
+    except (KeyError, ValueError, IndexError) as e:
+        return str(e)
 
 def parse_input(user_input: str) -> tuple[str, list[str]]:
     """
@@ -48,9 +81,11 @@ def parse_input(user_input: str) -> tuple[str, list[str]]:
     Returns:
         tuple[str, list[str]]: A tuple containing the command and a list of arguments.
     """
-    action, *args = user_input.split()
-    action = action.strip().lower()
-    return action, args
+    parts = user_input.split(None, 1)
+    if not parts:
+        return "", []
+    args = parts[1].split() if len(parts) > 1 else []
+    return parts[0].casefold(), args
 
 def print_help() -> None:
     """
@@ -84,7 +119,7 @@ def main() -> None:
         action, args = parse_input(user_input)
         response = handle_action(action, args, book)
         print(response)
-        if action in ["close", "exit", "bye"]:
+        if action in _EXIT_COMMANDS:
             break
 
 if __name__ == "__main__":
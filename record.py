@@ -1,15 +1,18 @@
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, Optional, Set, Tuple
 from name import Name
 from phone import Phone
 from birthday import Birthday
 
+if TYPE_CHECKING:
+    from address_book import AddressBook
+
 class Record:
     """
     Class to represent a record in the address book.
 
     Attributes:
         name (Name): The name of the contact.
-        phones (List[Phone]): The list of phone numbers associated with the contact.
+        phones (Tuple[str, ...]): The phone numbers associated with the contact.
         birthday (Optional[Birthday]): The birthday of the contact.
     """
 
@@ -21,8 +24,32 @@ class Record:
             name (str): The name of the contact.
         """
         self.name = Name(name)
-        self.phones: List[Phone] = []
+        self._phone_values: Tuple[str, ...] = ()
+        self._phone_index: Set[str] = set()
+        self._phones_str: Optional[str] = None
         self.birthday: Optional[Birthday] = None
+        # Address books holding this record, keyed by id() since books are unhashable.
+        self._books: Dict[int, "AddressBook"] = {}
+
+    def _touch(self) -> None:
+        """
+        Bumps the mutation counter of every address book that holds this record.
+        """
+        for book in self._books.values():
+            book._mut += 1
+
+    @property
+    def phones(self) -> Tuple[str, ...]:
+        """
+        Returns the contact's phone numbers.
+
+        The numbers are validated when added, so they are stored and returned
+        as plain strings. Use add_phone, edit_phone and remove_phone to change them.
+
+        Returns:
+            Tuple[str, ...]: The phone numbers.
+        """
+        return self._phone_values
 
     def add_phone(self, phone: str) -> None:
         """
@@ -31,7 +58,11 @@ class Record:
         Args:
             phone (str): The phone number to add.
         """
-        self.phones.append(Phone(phone))
+        value = Phone(phone).value
+        self._phone_values += (value,)
+        self._phone_index.add(value)
+        self._phones_str = None
+        self._touch()
 
     def remove_phone(self, phone: str) -> None:
         """
@@ -40,7 +71,10 @@ class Record:
         Args:
             phone (str): The phone number to remove.
         """
-        self.phones = [p for p in self.phones if p.value != phone]
+        self._phone_values = tuple(p for p in self._phone_values if p != phone)
+        self._phone_index.discard(phone)
+        self._phones_str = None
+        self._touch()
 
     def edit_phone(self, old_phone: str, new_phone: str) -> None:
         """
@@ -49,12 +83,31 @@ class Record:
         Args:
             old_phone (str): The old phone number to be replaced.
             new_phone (str): The new phone number to replace the old one.
+
+        Raises:
+            ValueError: If the new phone number is not valid.
+        """
+        if old_phone not in self._phone_index:
+            return
+        new_phone = Phone(new_phone).value
+        self._phone_values = tuple(new_phone if p == old_phone else p for p in self._phone_values)
+        self._phone_index.discard(old_phone)
+        self._phone_index.add(new_phone)
+        self._phones_str = None
+        self._touch()
+
+    def phones_joined(self) -> str:
+        """
+        Returns the contact's phone numbers as a comma-separated string.
+
+        Returns:
+            str: The joined phone numbers, cached until the phones change.
         """
-        for phone in self.phones:
-            if phone.value == old_phone:
-                phone.value = new_phone
+        if self._phones_str is None:
+            self._phones_str = ", ".join(self._phone_values)
+        return self._phones_str
 
-    def find_phone(self, phone: str) -> Optional[Phone]:
+    def find_phone(self, phone: str) -> Optional[str]:
         """
         Finds a phone number in the contact.
 
@@ -62,12 +115,9 @@ class Record:
             phone (str): The phone number to find.
 
         Returns:
-            Optional[Phone]: The phone number if found, otherwise None.
+            Optional[str]: The phone number if found, otherwise None.
         """
-        for p in self.phones:
-            if p.value == phone:
-                return p
-        return None
+        return phone if phone in self._phone_index else None
 
     def add_birthday(self, birthday: str) -> None:
         """
@@ -76,7 +126,13 @@ class Record:
         Args:
             birthday (str): The birthday value in DD.MM.YYYY format.
         """
-        self.birthday = Birthday(birthday)
+        new_birthday = Birthday(birthday)
+        for book in self._books.values():
+            book._unindex_birthday(self)
+        self.birthday = new_birthday
+        for book in self._books.values():
+            book._index_birthday(self)
+        self._touch()
 
     def __str__(self) -> str:
         """
@@ -85,6 +141,6 @@ class Record:
         Returns:
             str: The string representation of the contact.
         """
-        phones = ", ".join([str(phone) for phone in self.phones])
+        phones = self.phones_joined()
         birthday = f", Birthday: {self.birthday}" if self.birthday else ""
         return f"Name: {self.name}, Phones: {phones}{birthday}"
\ No newline at end of file